@@ -19,18 +19,11 @@ import integration_test_utils
 from ucp_sdk.models.schemas.shopping import fulfillment_resp as checkout
 from ucp_sdk.models.schemas.shopping.ap2_mandate import Ap2CompleteRequest
 from ucp_sdk.models.schemas.shopping.ap2_mandate import CheckoutMandate
-from ucp_sdk.models.schemas.shopping.payment_resp import (
-  PaymentResponse as Payment,
-)
 from ucp_sdk.models.schemas.shopping.types import card_payment_instrument
 from ucp_sdk.models.schemas.shopping.types import payment_instrument
 from ucp_sdk.models.schemas.shopping.types import token_credential_resp
 
 
-# Rebuild models to resolve forward references
-checkout.Checkout.model_rebuild(_types_namespace={"PaymentResponse": Payment})
-
-
 class Ap2MandateTest(integration_test_utils.IntegrationTestBase):
   """Tests for AP2 Mandate.
 
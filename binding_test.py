@@ -17,9 +17,6 @@
 from absl.testing import absltest
 import integration_test_utils
 from ucp_sdk.models.schemas.shopping import fulfillment_resp as checkout
-from ucp_sdk.models.schemas.shopping.payment_resp import (
-  PaymentResponse as Payment,
-)
 from ucp_sdk.models.schemas.shopping.types import binding
 from ucp_sdk.models.schemas.shopping.types import card_payment_instrument
 from ucp_sdk.models.schemas.shopping.types import payment_identity
@@ -27,10 +24,6 @@ from ucp_sdk.models.schemas.shopping.types import payment_instrument
 from ucp_sdk.models.schemas.shopping.types import token_credential_resp
 
 
-# Rebuild models to resolve forward references
-checkout.Checkout.model_rebuild(_types_namespace={"PaymentResponse": Payment})
-
-
 class TokenBindingTest(integration_test_utils.IntegrationTestBase):
   """Tests for Token Binding.
 
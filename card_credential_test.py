@@ -17,17 +17,10 @@
 from absl.testing import absltest
 import integration_test_utils
 from ucp_sdk.models.schemas.shopping import fulfillment_resp as checkout
-from ucp_sdk.models.schemas.shopping.payment_resp import (
-  PaymentResponse as Payment,
-)
 from ucp_sdk.models.schemas.shopping.types import card_credential
 from ucp_sdk.models.schemas.shopping.types import card_payment_instrument
 
 
-# Rebuild models to resolve forward references
-checkout.Checkout.model_rebuild(_types_namespace={"PaymentResponse": Payment})
-
-
 class CardCredentialTest(integration_test_utils.IntegrationTestBase):
   """Tests for Card Credential.
 
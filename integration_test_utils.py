@@ -14,7 +14,9 @@
 
 """Shared utilities for UCP SDK integration tests."""
 
+from collections.abc import Collection
 import csv
+import functools
 import json
 import logging
 from pathlib import Path
@@ -41,6 +43,7 @@ from ucp_sdk.models.schemas.shopping.fulfillment_create_req import Fulfillment
 from ucp_sdk.models.schemas.shopping.fulfillment_update_req import (
   Checkout as FulfillmentUpdate,
 )
+from ucp_sdk.models.schemas.shopping.payment_resp import PaymentResponse
 from ucp_sdk.models.schemas.shopping.types import card_payment_instrument
 from ucp_sdk.models.schemas.shopping.types import fulfillment_destination_req
 from ucp_sdk.models.schemas.shopping.types import fulfillment_group_create_req
@@ -55,6 +58,13 @@ from ucp_sdk.models.schemas.shopping.types import shipping_destination_req
 import uvicorn
 
 
+# Resolve the Checkout response model's forward reference to PaymentResponse
+# once per process, for this module and every test module that imports it.
+f_models.Checkout.model_rebuild(
+  _types_namespace={"PaymentResponse": PaymentResponse}
+)
+
+
 class UnifiedUpdate(FulfillmentUpdate, DiscountUpdate):
   """Client-side unified update model to support extensions."""
 
@@ -113,6 +123,30 @@ class TestData:
 test_data = TestData()
 
 
+@functools.cache
+def load_conformance_config(path: str) -> dict[str, Any]:
+  """Load the conformance input configuration JSON.
+
+  The file is read once per path and the parsed result shared by every test,
+  so callers must treat the returned dictionary as read-only.
+
+  Args:
+      path: Path to the conformance input configuration JSON.
+
+  Returns:
+      The parsed configuration, or an empty dictionary if the file is missing.
+
+  """
+  try:
+    with Path(path).open() as f:
+      return json.load(f)
+  except FileNotFoundError:
+    logging.warning(
+      "Conformance input file not found at %s. Using defaults.", path
+    )
+    return {}
+
+
 def get_headers(
   idempotency_key: str | None = None, request_id: str | None = None
 ) -> dict[str, str]:
@@ -338,14 +372,29 @@ class MockWebhookServer:
     self.events = []
 
 
+# Status codes a server may use to acknowledge a created checkout session.
+_CREATED_STATUSES = frozenset({200, 201})
+
+
 class IntegrationTestBase(absltest.TestCase):
   """Base class for UCP integration tests providing setup and helper methods."""
 
-  def setUp(self) -> None:
-    """Set up the test case, including clients and mock servers."""
-    super().setUp()
-    self.base_url = FLAGS.server_url
-    self.client = httpx.Client(base_url=self.base_url)
+  # Shopping service endpoint from discovery, resolved once per class.
+  _shopping_service_endpoint: str | None = None
+
+  @classmethod
+  def setUpClass(cls) -> None:
+    """Set up the client, test data and mock servers shared by the class.
+
+    Everything here is independent of the individual test method, so it is
+    done once per class rather than in setUp for every test.
+    """
+    super().setUpClass()
+    cls.base_url = FLAGS.server_url
+    # One client per class so pooled keep-alive connections are reused
+    # across tests instead of reconnecting for every test method.
+    cls.client = httpx.Client(base_url=cls.base_url)
+    cls.addClassCleanup(cls.client.close)
 
     # Configure httpx logging based on flag
     httpx_logger = logging.getLogger("httpx")
@@ -355,15 +404,7 @@ class IntegrationTestBase(absltest.TestCase):
       httpx_logger.setLevel(logging.WARNING)
 
     # Load conformance input configuration
-    try:
-      with Path(FLAGS.conformance_input).open() as f:
-        self.conformance_config = json.load(f)
-    except FileNotFoundError:
-      logging.warning(
-        "Conformance input file not found at %s. Using defaults.",
-        FLAGS.conformance_input,
-      )
-      self.conformance_config = {}
+    cls.conformance_config = load_conformance_config(FLAGS.conformance_input)
 
     # Load CSV Test Data
     try:
@@ -379,15 +420,16 @@ class IntegrationTestBase(absltest.TestCase):
       logging.warning("Failed to load test CSV data: %s", e)
 
     # Start the agent profile server
-    self.agent_server = AgentProfileServer(
+    cls.agent_server = AgentProfileServer(
       port=FLAGS.mock_agent_port, webhook_port=FLAGS.mock_webhook_port
     )
-    self.agent_server.start()
-    self._shopping_service_endpoint: str | None = None
+    cls.addClassCleanup(cls.agent_server.stop)
+    cls.agent_server.start()
+    cls._shopping_service_endpoint = None
 
   @property
   def shopping_service_endpoint(self) -> str:
-    """Cached property for the shopping service endpoint."""
+    """Class-wide cached property for the shopping service endpoint."""
     if self._shopping_service_endpoint is None:
       discovery_resp = self.client.get("/.well-known/ucp")
       self.assert_response_status(discovery_resp, 200)
@@ -395,7 +437,9 @@ class IntegrationTestBase(absltest.TestCase):
       shopping_service = profile.ucp.services.root.get("dev.ucp.shopping")
       if not shopping_service or not shopping_service.rest:
         raise RuntimeError("Shopping service not found in discovery profile")
-      self._shopping_service_endpoint = str(shopping_service.rest.endpoint)
+      type(self)._shopping_service_endpoint = str(
+        shopping_service.rest.endpoint
+      )
     return self._shopping_service_endpoint
 
   def get_shopping_url(self, path: str) -> str:
@@ -413,13 +457,6 @@ class IntegrationTestBase(absltest.TestCase):
     path = path.lstrip("/")
     return f"{base}/{path}"
 
-  def tearDown(self) -> None:
-    """Tear down the test case, stopping servers and clients."""
-    self.client.close()
-    if hasattr(self, "agent_server"):
-      self.agent_server.stop()
-    super().tearDown()
-
   def create_checkout_payload(
     self,
     quantity=1,
@@ -531,32 +568,29 @@ class IntegrationTestBase(absltest.TestCase):
     return get_headers(idempotency_key, request_id)
 
   def assert_response_status(
-    self, response: httpx.Response, expected_code: int | list[int]
+    self, response: httpx.Response, expected_code: int | Collection[int]
   ) -> None:
     """Assert that the response status code matches the expected code(s).
 
     Args:
         response: The httpx response object.
-        expected_code: An integer or list of integers representing valid status
-          codes.
+        expected_code: An integer or collection of integers representing valid
+          status codes.
 
     Raises:
         AssertionError: If the response status code is not in expected_code.
 
     """
-    if isinstance(expected_code, int):
-      expected_codes = [expected_code]
-    else:
-      expected_codes = expected_code
+    codes = (
+      (expected_code,) if isinstance(expected_code, int) else expected_code
+    )
 
-    self.assertIn(
-      response.status_code,
-      expected_codes,
-      msg=(
-        f"Expected status {expected_code}, got {response.status_code}."
+    # Only decode the body for the failure message once a mismatch is known.
+    if response.status_code not in codes:
+      self.fail(
+        f"Expected status {sorted(codes)}, got {response.status_code}."
         f" Resp: {response.text}"
-      ),
-    )
+      )
 
   def create_checkout_session(
     self,
@@ -598,17 +632,16 @@ class IntegrationTestBase(absltest.TestCase):
     )
 
     request_headers = self.get_headers()
+    request_headers["Content-Type"] = "application/json"
     if headers:
       request_headers.update(headers)
 
     response = self.client.post(
       self.get_shopping_url("/checkout-sessions"),
-      json=create_payload.model_dump(
-        mode="json", by_alias=True, exclude_none=True
-      ),
+      content=create_payload.model_dump_json(by_alias=True, exclude_none=True),
       headers=request_headers,
     )
-    self.assert_response_status(response, [200, 201])
+    self.assert_response_status(response, _CREATED_STATUSES)
     checkout_data = response.json()
 
     if select_fulfillment:
@@ -646,7 +679,8 @@ class IntegrationTestBase(absltest.TestCase):
     if is_ready(checkout_data):
       return checkout_data
 
-    checkout_obj = f_models.Checkout(**checkout_data)
+    # Each step inspects the raw response dict; the Checkout model that
+    # update_checkout_session needs is only built when a step sends an update.
 
     # 1. Trigger fulfillment with a default address if none exists
     has_destinations = (
@@ -681,10 +715,9 @@ class IntegrationTestBase(absltest.TestCase):
         method_payload["id"] = method_id
 
       checkout_data = self.update_checkout_session(
-        checkout_obj,
+        f_models.Checkout(**checkout_data),
         fulfillment={"methods": [method_payload]},
       )
-      checkout_obj = f_models.Checkout(**checkout_data)
 
     # 2. Select Destination (if not already selected)
     method = checkout_data["fulfillment"]["methods"][0]
@@ -701,10 +734,9 @@ class IntegrationTestBase(absltest.TestCase):
       # Ensure we keep destinations
 
       checkout_data = self.update_checkout_session(
-        checkout_obj,
+        f_models.Checkout(**checkout_data),
         fulfillment={"methods": [method_payload]},
       )
-      checkout_obj = f_models.Checkout(**checkout_data)
 
     # 3. Select Option
     method = checkout_data["fulfillment"]["methods"][0]
@@ -726,7 +758,7 @@ class IntegrationTestBase(absltest.TestCase):
       method_payload["groups"][0]["selected_option_id"] = option_id
 
       checkout_data = self.update_checkout_session(
-        checkout_obj,
+        f_models.Checkout(**checkout_data),
         fulfillment={"methods": [method_payload]},
       )
 
@@ -850,14 +882,13 @@ class IntegrationTestBase(absltest.TestCase):
     )
 
     request_headers = self.get_headers()
+    request_headers["Content-Type"] = "application/json"
     if headers:
       request_headers.update(headers)
 
     response = self.client.put(
       self.get_shopping_url(f"/checkout-sessions/{checkout_obj.id}"),
-      json=update_payload.model_dump(
-        mode="json", by_alias=True, exclude_none=True
-      ),
+      content=update_payload.model_dump_json(by_alias=True, exclude_none=True),
       headers=request_headers,
     )
     self.assert_response_status(response, 200)
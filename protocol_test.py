@@ -18,13 +18,6 @@ from absl.testing import absltest
 import integration_test_utils
 import httpx
 from ucp_sdk.models.discovery.profile_schema import UcpDiscoveryProfile
-from ucp_sdk.models.schemas.shopping import fulfillment_resp as checkout
-from ucp_sdk.models.schemas.shopping.payment_resp import (
-  PaymentResponse as Payment,
-)
-
-# Rebuild models to resolve forward references
-checkout.Checkout.model_rebuild(_types_namespace={"PaymentResponse": Payment})
 
 
 class ProtocolTest(integration_test_utils.IntegrationTestBase):
@@ -14,23 +14,21 @@
 
 """Validation tests for the UCP SDK Server."""
 
+from typing import Any
+import uuid
+
 from absl.testing import absltest
+from absl.testing import parameterized
 import integration_test_utils
 from ucp_sdk.models.schemas.shopping import checkout_update_req
-from ucp_sdk.models.schemas.shopping import fulfillment_resp as checkout
 from ucp_sdk.models.schemas.shopping import payment_update_req
-from ucp_sdk.models.schemas.shopping.payment_resp import (
-  PaymentResponse as Payment,
-)
 from ucp_sdk.models.schemas.shopping.types import item_update_req
 from ucp_sdk.models.schemas.shopping.types import line_item_update_req
 
 
-# Rebuild models to resolve forward references
-checkout.Checkout.model_rebuild(_types_namespace={"PaymentResponse": Payment})
-
-
-class ValidationTest(integration_test_utils.IntegrationTestBase):
+class ValidationTest(
+  integration_test_utils.IntegrationTestBase, parameterized.TestCase
+):
   """Tests for input validation and error handling.
 
   Validated Paths:
@@ -39,39 +37,45 @@ class ValidationTest(integration_test_utils.IntegrationTestBase):
   - POST /checkout-sessions/{id}/complete
   """
 
-  def test_out_of_stock(self) -> None:
-    """Test validation for out-of-stock items.
+  # Checkout-sessions URLs, built from the discovered shopping endpoint by
+  # the first test and reused by the rest of the class.
+  _url_sessions: str = ""
+  _url_session_tpl: str = ""
 
-    Given a product with 0 inventory,
-    When a checkout creation request is made for this item,
-    Then the server should return a 400 Bad Request error indicating
-    insufficient stock.
-    """
-    # Get out of stock item from config
-    out_of_stock_item = self.conformance_config.get(
-      "out_of_stock_item",
-      {"id": "out_of_stock_item_1", "title": "Out of Stock Item"},
-    )
+  def setUp(self) -> None:
+    """Set up the test case, building the class-wide checkout URLs once."""
+    super().setUp()
+    cls = type(self)
+    if not cls._url_sessions:
+      cls._url_sessions = self.get_shopping_url("/checkout-sessions")
+      cls._url_session_tpl = cls._url_sessions + "/{}"
 
-    create_payload = self.create_checkout_payload(
-      item_id=out_of_stock_item["id"],
-      title=out_of_stock_item["title"],
-    )
+  # Serialized create payloads keyed by (item_id, title). Building and dumping
+  # a CheckoutCreateRequest walks the whole model tree, so it is done once per
+  # distinct item and only the checkout ID is refreshed per request.
+  _create_payloads: dict[tuple[str, str | None], dict[str, Any]] = {}
 
-    response = self.client.post(
-      self.get_shopping_url("/checkout-sessions"),
-      json=create_payload.model_dump(
-        mode="json", by_alias=True, exclude_none=True
-      ),
-      headers=integration_test_utils.get_headers(),
-    )
+  def _get_create_payload(
+    self, item_id: str, title: str | None = None
+  ) -> dict[str, Any]:
+    """Return a serialized checkout creation payload for the given item.
 
-    self.assert_response_status(response, 400)
-    self.assertIn(
-      "Insufficient stock",
-      response.text,
-      msg="Expected 'Insufficient stock' message",
-    )
+    Args:
+        item_id: ID of the item.
+        title: Title of the item. Defaults to config or "Test Item".
+
+    Returns:
+        A JSON-ready payload dictionary with a fresh checkout ID.
+
+    """
+    key = (item_id, title)
+    payload = self._create_payloads.get(key)
+    if payload is None:
+      payload = self.create_checkout_payload(
+        item_id=item_id, title=title
+      ).model_dump(mode="json", by_alias=True, exclude_none=True)
+      self._create_payloads[key] = payload
+    return {**payload, "id": str(uuid.uuid4())}
 
   def test_update_inventory_validation(self) -> None:
     """Test that inventory validation is enforced on update.
@@ -81,42 +85,50 @@ class ValidationTest(integration_test_utils.IntegrationTestBase):
     Then the server should return a 400 Bad Request error indicating
     insufficient stock.
     """
-    response_json = self.create_checkout_session()
-    checkout_obj = checkout.Checkout(**response_json)
-    checkout_id = checkout_obj.id
-
-    # Update to excessive quantity (e.g. 10000)
-    item_update = item_update_req.ItemUpdateRequest(
-      id=checkout_obj.line_items[0].item.id,
-      title=checkout_obj.line_items[0].item.title,
+    # Build the update straight from the response JSON: unchanged subtrees
+    # (e.g. payment handlers) are sent back as-is rather than parsed into
+    # response models and dumped again.
+    checkout_data = self.create_checkout_session()
+    checkout_id = checkout_data["id"]
+    line_item = checkout_data["line_items"][0]
+    payment = checkout_data["payment"]
+
+    # Update to excessive quantity (e.g. 10000). It is the server's validation
+    # under test, so the item and line item wrappers skip client-side
+    # validation.
+    item_update = item_update_req.ItemUpdateRequest.model_construct(
+      id=line_item["item"]["id"],
+      title=line_item["item"]["title"],
     )
-    line_item_update = line_item_update_req.LineItemUpdateRequest(
-      id=checkout_obj.line_items[0].id,
-      item=item_update,
-      quantity=10001,
+    line_item_update = (
+      line_item_update_req.LineItemUpdateRequest.model_construct(
+        id=line_item["id"],
+        item=item_update,
+        quantity=10001,
+      )
     )
+    # Validate the payment block so the raw response instruments are converted
+    # to the request's instrument models instead of being dumped as-is.
     payment_update = payment_update_req.PaymentUpdateRequest(
-      selected_instrument_id=checkout_obj.payment.selected_instrument_id,
-      instruments=checkout_obj.payment.instruments,
-      handlers=[
-        h.model_dump(mode="json", exclude_none=True)
-        for h in checkout_obj.payment.handlers
-      ],
+      selected_instrument_id=payment.get("selected_instrument_id"),
+      instruments=payment.get("instruments"),
+      handlers=payment["handlers"],
     )
 
-    update_payload = checkout_update_req.CheckoutUpdateRequest(
+    update_payload = checkout_update_req.CheckoutUpdateRequest.model_construct(
       id=checkout_id,
-      currency=checkout_obj.currency,
+      currency=checkout_data["currency"],
       line_items=[line_item_update],
       payment=payment_update,
     )
 
     response = self.client.put(
-      self.get_shopping_url(f"/checkout-sessions/{checkout_id}"),
-      json=update_payload.model_dump(
-        mode="json", by_alias=True, exclude_none=True
-      ),
-      headers=integration_test_utils.get_headers(),
+      self._url_session_tpl.format(checkout_id),
+      content=update_payload.model_dump_json(by_alias=True, exclude_none=True),
+      headers={
+        **integration_test_utils.get_headers(),
+        "Content-Type": "application/json",
+      },
     )
 
     self.assert_response_status(response, 400)
@@ -124,35 +136,53 @@ class ValidationTest(integration_test_utils.IntegrationTestBase):
       "stock", response.text.lower(), msg="Expected 'stock' message"
     )
 
-  def test_product_not_found(self) -> None:
-    """Test validation for non-existent products.
-
-    Given a request for a product ID that does not exist in the catalog,
-    When a checkout creation request is made,
-    Then the server should return a 400 Bad Request error indicating the product
-    was not found.
-    """
-    non_existent_item = self.conformance_config.get(
+  @parameterized.named_parameters(
+    (
+      "_out_of_stock",
+      "out_of_stock_item",
+      {"id": "out_of_stock_item_1", "title": "Out of Stock Item"},
+      r"Insufficient stock",
+    ),
+    (
+      "_product_not_found",
       "non_existent_item",
       {"id": "non_existent_item_1", "title": "Non-existent Item"},
-    )
+      r"(?i)not found",
+    ),
+  )
+  def test_create_with_invalid_item(
+    self,
+    config_key: str,
+    default_item: dict[str, str],
+    expected_message: str,
+  ) -> None:
+    """Test validation for items that cannot be purchased.
+
+    Given a product with 0 inventory, or a product ID that does not exist in
+    the catalog,
+    When a checkout creation request is made for this item,
+    Then the server should return a 400 Bad Request error indicating
+    insufficient stock or that the product was not found, respectively.
 
-    create_payload = self.create_checkout_payload(
-      item_id=non_existent_item["id"],
-      title=non_existent_item["title"],
-    )
+    Args:
+        config_key: Conformance config key holding the item.
+        default_item: Item to use if the config does not define one.
+        expected_message: Regex the error response body must match.
+
+    """
+    item = self.conformance_config.get(config_key, default_item)
 
     response = self.client.post(
-      self.get_shopping_url("/checkout-sessions"),
-      json=create_payload.model_dump(
-        mode="json", by_alias=True, exclude_none=True
-      ),
+      self._url_sessions,
+      json=self._get_create_payload(item["id"], item["title"]),
       headers=integration_test_utils.get_headers(),
     )
 
     self.assert_response_status(response, 400)
-    self.assertIn(
-      "not found", response.text.lower(), msg="Expected 'not found' message"
+    self.assertRegex(
+      response.text,
+      expected_message,
+      msg=f"Expected '{expected_message}' message",
     )
 
   def test_payment_failure(self) -> None:
@@ -164,7 +194,7 @@ class ValidationTest(integration_test_utils.IntegrationTestBase):
     Then the server should return a 402 Payment Required error.
     """
     response_json = self.create_checkout_session(handlers=[])
-    checkout_id = checkout.Checkout(**response_json).id
+    checkout_id = response_json["id"]
 
     # Use the helper to get valid structure, but request the failing instrument
     # 'instr_fail' is loaded from payment_instruments.csv
@@ -173,7 +203,7 @@ class ValidationTest(integration_test_utils.IntegrationTestBase):
     )
 
     response = self.client.post(
-      self.get_shopping_url(f"/checkout-sessions/{checkout_id}/complete"),
+      self._url_session_tpl.format(checkout_id) + "/complete",
       json=payment_payload,
       headers=integration_test_utils.get_headers(),
     )
@@ -193,7 +223,7 @@ class ValidationTest(integration_test_utils.IntegrationTestBase):
     payment_payload = integration_test_utils.get_valid_payment_payload()
 
     response = self.client.post(
-      self.get_shopping_url(f"/checkout-sessions/{checkout_id}/complete"),
+      self._url_session_tpl.format(checkout_id) + "/complete",
       json=payment_payload,
       headers=integration_test_utils.get_headers(),
     )
@@ -219,14 +249,10 @@ class ValidationTest(integration_test_utils.IntegrationTestBase):
       {"id": "out_of_stock_item_1", "title": "Out of Stock Item"},
     )
 
-    create_payload = self.create_checkout_payload(
-      item_id=out_of_stock_item["id"],
-    )
-
     response = self.client.post(
-      self.get_shopping_url("/checkout-sessions"),
-      json=create_payload.model_dump(
-        mode="json", by_alias=True, exclude_none=True
+      self._url_sessions,
+      json=self._get_create_payload(
+        out_of_stock_item["id"], out_of_stock_item["title"]
       ),
       headers=integration_test_utils.get_headers(),
     )
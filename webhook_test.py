@@ -18,14 +18,6 @@ import time
 from absl.testing import absltest
 import integration_test_utils
 from ucp_sdk.models.schemas.shopping import fulfillment_resp
-from ucp_sdk.models.schemas.shopping.payment_resp import (
-  PaymentResponse as Payment,
-)
-
-# Rebuild models to resolve forward references
-fulfillment_resp.Checkout.model_rebuild(
-  _types_namespace={"PaymentResponse": Payment}
-)
 
 
 class WebhookTest(integration_test_utils.IntegrationTestBase):